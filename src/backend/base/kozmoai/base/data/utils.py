@@ -5,10 +5,10 @@ from pathlib import Path
 
 import chardet
 import orjson
-import yaml
 from defusedxml import ElementTree
 
 from kozmoai.schema import Data
+from kozmoai.utils.yaml_utils import safe_load
 
 # Types of files that can be read simply by file.read()
 # and have 100% to be completely readable
@@ -154,7 +154,7 @@ def parse_text_file_to_data(file_path: str, *, silent_errors: bool) -> Data | No
             text = orjson.dumps(text).decode("utf-8")
 
         elif file_path.endswith((".yaml", ".yml")):
-            text = yaml.safe_load(text)
+            text = safe_load(text)
         elif file_path.endswith(".xml"):
             xml_element = ElementTree.fromstring(text)
             text = ElementTree.tostring(xml_element, encoding="unicode")
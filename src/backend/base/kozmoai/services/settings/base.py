@@ -17,6 +17,7 @@ from typing_extensions import override
 
 from kozmoai.services.settings.constants import VARIABLES_TO_GET_FROM_ENVIRONMENT
 from kozmoai.utils.util_strings import is_valid_database_url
+from kozmoai.utils.yaml_utils import safe_load
 
 # BASE_COMPONENTS_PATH = str(Path(__file__).parent / "components")
 BASE_COMPONENTS_PATH = str(Path(__file__).parent.parent.parent / "components")
@@ -426,7 +427,7 @@ async def load_settings_from_yaml(file_path: str) -> Settings:
 
     async with async_open(file_path_.name, encoding="utf-8") as f:
         content = await f.read()
-        settings_dict = yaml.safe_load(content)
+        settings_dict = safe_load(content)
         settings_dict = {k.upper(): v for k, v in settings_dict.items()}
 
         for key in settings_dict:
@@ -2,12 +2,12 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import yaml
 from loguru import logger
 
 from kozmoai.services.base import Service
 from kozmoai.services.settings.auth import AuthSettings
 from kozmoai.services.settings.base import Settings
+from kozmoai.utils.yaml_utils import safe_load
 
 
 class SettingsService(Service):
@@ -29,7 +29,7 @@ class SettingsService(Service):
             file_path_ = Path(file_path)
 
         with file_path_.open(encoding="utf-8") as f:
-            settings_dict = yaml.safe_load(f)
+            settings_dict = safe_load(f)
             settings_dict = {k.upper(): v for k, v in settings_dict.items()}
 
             for key in settings_dict:
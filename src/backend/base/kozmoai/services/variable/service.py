@@ -5,7 +5,8 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
 from loguru import logger
-from sqlmodel import select
+from sqlalchemy import delete
+from sqlmodel import col, select
 from typing_extensions import override
 
 from kozmoai.services.auth import utils as auth_utils
@@ -33,26 +34,48 @@ class DatabaseVariableService(VariableService, Service):
             return
 
         logger.info("Storing environment variables in the database.")
+        env_values: dict[str, str] = {}
         for var_name in self.settings_service.settings.variables_to_get_from_environment:
             if var_name in os.environ and os.environ[var_name].strip():
-                value = os.environ[var_name].strip()
-                query = select(Variable).where(Variable.user_id == user_id, Variable.name == var_name)
-                existing = (await session.exec(query)).first()
-                try:
-                    if existing:
-                        await self.update_variable(user_id, var_name, value, session)
-                    else:
-                        await self.create_variable(
-                            user_id=user_id,
-                            name=var_name,
-                            value=value,
-                            default_fields=[],
-                            type_=CREDENTIAL_TYPE,
-                            session=session,
-                        )
-                    logger.info(f"Processed {var_name} variable from environment.")
-                except Exception as e:  # noqa: BLE001
-                    logger.exception(f"Error processing {var_name} variable: {e!s}")
+                env_values[var_name] = os.environ[var_name].strip()
+        if not env_values:
+            return
+
+        # Load every variable that may need updating in a single query and commit once at the end
+        query = select(Variable).where(Variable.user_id == user_id, col(Variable.name).in_(list(env_values)))
+        existing = {variable.name: variable for variable in (await session.exec(query)).all()}
+        for var_name, value in env_values.items():
+            try:
+                if var_name in existing:
+                    existing[var_name].value = auth_utils.encrypt_api_key(value, settings_service=self.settings_service)
+                else:
+                    session.add(self._build_variable(user_id, var_name, value))
+                logger.info(f"Processed {var_name} variable from environment.")
+            except Exception as e:  # noqa: BLE001
+                logger.exception(f"Error processing {var_name} variable: {e!s}")
+        try:
+            await session.commit()
+        except Exception as e:  # noqa: BLE001
+            # A failed commit drops the whole batch, but must not break login or superuser setup
+            await session.rollback()
+            logger.exception(f"Error storing environment variables: {e!s}")
+
+    def _build_variable(
+        self,
+        user_id: UUID | str,
+        name: str,
+        value: str,
+        *,
+        default_fields: Sequence[str] = (),
+        type_: str = CREDENTIAL_TYPE,
+    ) -> Variable:
+        variable_base = VariableCreate(
+            name=name,
+            type=type_,
+            value=auth_utils.encrypt_api_key(value, settings_service=self.settings_service),
+            default_fields=list(default_fields),
+        )
+        return Variable.model_validate(variable_base, from_attributes=True, update={"user_id": user_id})
 
     async def get_variable(
         self,
@@ -93,17 +116,27 @@ class DatabaseVariableService(VariableService, Service):
                     value = auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
                 except Exception as e:  # noqa: BLE001
                     logger.debug(
-                        f"Decryption of {variable.type} failed for variable '{variable.name}': {e}. Assuming plaintext."
+                        "Decryption of {} failed for variable '{}': {}. Assuming plaintext.",
+                        variable.type,
+                        variable.name,
+                        e,
                     )
                     value = variable.value
-            variable_read = VariableRead.model_validate(variable, from_attributes=True)
-            variable_read.value = value
+            # The value is resolved above, so skip re-running VariableRead's validators per row
+            variable_read = VariableRead.model_construct(
+                id=variable.id,
+                name=variable.name,
+                type=variable.type,
+                value=value,
+                default_fields=variable.default_fields,
+            )
             variables_read.append(variable_read)
         return variables_read
 
     async def list_variables(self, user_id: UUID | str, session: AsyncSession) -> list[str | None]:
-        variables = await self.get_all(user_id=user_id, session=session)
-        return [variable.name for variable in variables if variable]
+        # Only the names are needed, so skip loading and decrypting the full rows
+        stmt = select(Variable.name).where(Variable.user_id == user_id)
+        return list((await session.exec(stmt)).all())
 
     async def update_variable(
         self,
@@ -119,7 +152,6 @@ class DatabaseVariableService(VariableService, Service):
             raise ValueError(msg)
         encrypted = auth_utils.encrypt_api_key(value, settings_service=self.settings_service)
         variable.value = encrypted
-        session.add(variable)
         await session.commit()
         await session.refresh(variable)
         return variable
@@ -143,7 +175,6 @@ class DatabaseVariableService(VariableService, Service):
         for key, value in variable_data.items():
             setattr(db_variable, key, value)
 
-        session.add(db_variable)
         await session.commit()
         await session.refresh(db_variable)
         return db_variable
@@ -155,22 +186,20 @@ class DatabaseVariableService(VariableService, Service):
         name: str,
         session: AsyncSession,
     ) -> None:
-        stmt = select(Variable).where(Variable.user_id == user_id).where(Variable.name == name)
-        variable = (await session.exec(stmt)).first()
-        if not variable:
+        stmt = delete(Variable).where(Variable.user_id == user_id, Variable.name == name)
+        result = await session.exec(stmt)
+        if not result.rowcount:
             msg = f"{name} variable not found."
             raise ValueError(msg)
-        await session.delete(variable)
         await session.commit()
 
     @override
     async def delete_variable_by_id(self, user_id: UUID | str, variable_id: UUID, session: AsyncSession) -> None:
-        stmt = select(Variable).where(Variable.user_id == user_id, Variable.id == variable_id)
-        variable = (await session.exec(stmt)).first()
-        if not variable:
+        stmt = delete(Variable).where(Variable.user_id == user_id, Variable.id == variable_id)
+        result = await session.exec(stmt)
+        if not result.rowcount:
             msg = f"{variable_id} variable not found."
             raise ValueError(msg)
-        await session.delete(variable)
         await session.commit()
 
     async def create_variable(
@@ -183,13 +212,7 @@ class DatabaseVariableService(VariableService, Service):
         type_: str = CREDENTIAL_TYPE,
         session: AsyncSession,
     ):
-        variable_base = VariableCreate(
-            name=name,
-            type=type_,
-            value=auth_utils.encrypt_api_key(value, settings_service=self.settings_service),
-            default_fields=list(default_fields),
-        )
-        variable = Variable.model_validate(variable_base, from_attributes=True, update={"user_id": user_id})
+        variable = self._build_variable(user_id, name, value, default_fields=default_fields, type_=type_)
         session.add(variable)
         await session.commit()
         await session.refresh(variable)
@@ -0,0 +1,11 @@
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+
+def safe_load(stream):
+    """Parse a YAML document like `yaml.safe_load`, using libyaml's C loader when PyYAML was built with it."""
+    return yaml.load(stream, Loader=SafeLoader)
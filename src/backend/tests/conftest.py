@@ -1,5 +1,6 @@
 import asyncio
 import json
+import os
 import shutil
 
 # we need to import tmpdir
@@ -17,6 +18,7 @@ from blockbuster import blockbuster_ctx
 from dotenv import load_dotenv
 from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient
+from hypothesis import settings as hypothesis_settings
 from kozmoai.components.inputs import ChatInput
 from kozmoai.graph import Graph
 from kozmoai.initial_setup.constants import STARTER_FOLDER_NAME
@@ -42,6 +44,11 @@ from tests.api_keys import get_openai_api_key
 
 load_dotenv()
 
+# Keep local runs quick; CI sets HYPOTHESIS_PROFILE=ci for the full example count
+hypothesis_settings.register_profile("dev", max_examples=10)
+hypothesis_settings.register_profile("ci", max_examples=100)
+hypothesis_settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "dev"))
+
 
 @pytest.fixture(autouse=True)
 def blockbuster(request):
@@ -73,6 +80,7 @@ def blockbuster(request):
                 .can_block_in("httpx/_client.py", "_init_transport")
                 .can_block_in("rich/traceback.py", "_render_stack")
                 .can_block_in("langchain_core/_api/internal.py", "is_caller_internal")
+                .can_block_in("langchain_core/runnables/utils.py", "get_function_nonlocals")
             )
 
             (
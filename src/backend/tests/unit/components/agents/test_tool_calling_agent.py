@@ -4,6 +4,15 @@ import pytest
 from kozmoai.components.langchain_utilities import ToolCallingAgentComponent
 from kozmoai.components.models.openai import OpenAIModelComponent
 from kozmoai.components.tools.calculator_core import CalculatorComponent
+from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+from langchain_core.messages import AIMessage
+
+
+class ToolCallingFakeChatModel(FakeMessagesListChatModel):
+    """Replays scripted responses; tool binding is a no-op since the tool calls are scripted too."""
+
+    def bind_tools(self, tools, **kwargs):  # noqa: ARG002
+        return self
 
 
 @pytest.mark.api_key_required
@@ -27,3 +36,28 @@ async def test_tool_calling_agent_component():
     # Chat output
     response = await agent.message_response()
     assert "4" in response.data.get("text")
+
+
+async def test_tool_calling_agent_component_with_fake_llm():
+    tools = await CalculatorComponent().to_toolkit()
+    llm = ToolCallingFakeChatModel(
+        responses=[
+            AIMessage(
+                content="",
+                tool_calls=[{"name": tools[0].name, "args": {"expression": "2 + 2"}, "id": "call_1"}],
+            ),
+            AIMessage(content="The answer is 4"),
+        ]
+    )
+
+    async def send_message(message, **_):
+        return message
+
+    agent = ToolCallingAgentComponent()
+    agent.set(llm=llm, tools=tools, chat_history=[], input_value="What is 2 + 2?")
+    agent.send_message = send_message
+
+    response = await agent.message_response()
+    tool_steps = [step for step in response.content_blocks[0].contents if step.type == "tool_use"]
+    assert [step.output for step in tool_steps] == [{"result": "4"}]
+    assert "4" in response.data.get("text")
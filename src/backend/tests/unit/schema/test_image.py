@@ -1,5 +1,3 @@
-import tempfile
-
 import aiofiles
 import pytest
 from kozmoai.schema.image import (
@@ -11,24 +9,22 @@ from PIL import Image as PILImage
 
 
 @pytest.fixture
-def file_image():
-    image = PILImage.new("RGB", (100, 100), (255, 0, 0))
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=True) as temp_file:
-        image.save(temp_file.name)
-        yield temp_file.name
+def file_image(tmp_path):
+    file_path = tmp_path / "image.png"
+    PILImage.new("RGB", (100, 100), (255, 0, 0)).save(file_path)
+    return str(file_path)
 
 
 @pytest.fixture
-def file_txt():
+def file_txt(tmp_path):
     content = """\
 line1: This is an example text file.
 line2: It can be used for testing.
 line3: End of file.
 """
-    with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as temp_file:
-        temp_file.write(content.encode())
-        temp_file.flush()
-        yield temp_file.name
+    file_path = tmp_path / "file.txt"
+    file_path.write_text(content)
+    return str(file_path)
 
 
 def test_is_image_file(file_image):
@@ -4,7 +4,7 @@ from typing import Any
 
 import numpy as np
 import pandas as pd
-from hypothesis import given, settings
+from hypothesis import given
 from hypothesis import strategies as st
 from langchain_core.documents import Document
 from kozmoai.serialization.constants import MAX_ITEMS_LENGTH, MAX_TEXT_LENGTH
@@ -50,7 +50,6 @@ class LegacyModel(PydanticV1BaseModel):
 class TestSerializationHypothesis:
     """Hypothesis-based property tests for serialization logic."""
 
-    @settings(max_examples=100)
     @given(text=text_strategy)
     def test_string_serialization(self, text: str) -> None:
         result: str = serialize(text)
@@ -60,7 +59,6 @@ class TestSerializationHypothesis:
         else:
             assert result == text
 
-    @settings(max_examples=100)
     @given(data=bytes_strategy)
     def test_bytes_serialization(self, data: bytes) -> None:
         result: str = serialize(data)
@@ -71,25 +69,21 @@ class TestSerializationHypothesis:
         else:
             assert result == decoded
 
-    @settings(max_examples=100)
     @given(dt=datetime_strategy)
     def test_datetime_serialization(self, dt: datetime) -> None:
         result: str = serialize(dt)
         assert result == dt.replace(tzinfo=timezone.utc).isoformat()
 
-    @settings(max_examples=100)
     @given(dec=decimal_strategy)
     def test_decimal_serialization(self, dec) -> None:
         result: float = serialize(dec)
         assert result == float(dec)
 
-    @settings(max_examples=100)
     @given(uid=uuid_strategy)
     def test_uuid_serialization(self, uid) -> None:
         result: str = serialize(uid)
         assert result == str(uid)
 
-    @settings(max_examples=100)
     @given(lst=list_strategy)
     def test_list_truncation(self, lst: list) -> None:
         result: list = serialize(lst)
@@ -99,7 +93,6 @@ class TestSerializationHypothesis:
         else:
             assert result == lst
 
-    @settings(max_examples=100)
     @given(dct=dict_strategy)
     def test_dict_serialization(self, dct: dict) -> None:
         result: dict = serialize(dct)
@@ -108,14 +101,12 @@ class TestSerializationHypothesis:
             assert isinstance(k, str)
             assert isinstance(v, int | float | str | bool | type(None))
 
-    @settings(max_examples=100)
     @given(value=st.integers())
     def test_pydantic_modern_model(self, value: int) -> None:
         model: ModernModel = ModernModel(name="test", value=value)
         result: dict = serialize(model)
         assert result == {"name": "test", "value": value}
 
-    @settings(max_examples=100)
     @given(value=st.integers())
     def test_pydantic_v1_model(self, value: int) -> None:
         model: LegacyModel = LegacyModel(name="test", value=value)
@@ -131,7 +122,6 @@ class TestSerializationHypothesis:
         result: str = serialize(gen)
         assert result == "Unconsumed Stream"
 
-    @settings(max_examples=100)
     @given(data=st.one_of(st.integers(), st.floats(allow_nan=True), st.booleans(), st.none()))
     def test_primitive_types(self, data: float | bool | None) -> None:
         result: int | float | bool | None = serialize(data)
@@ -140,25 +130,21 @@ class TestSerializationHypothesis:
         else:
             assert result == data
 
-    @settings(max_examples=100)
     @given(nested=nested_strategy)
     def test_nested_structures(self, nested: Any) -> None:
         result: list | dict | int | float | str | bool = serialize(nested)
         assert isinstance(result, list | dict | int | float | str | bool)
 
-    @settings(max_examples=100)
     @given(text=text_strategy)
     def test_max_length_none(self, text: str) -> None:
         result: str = serialize(text, max_length=None)
         assert result == text
 
-    @settings(max_examples=100)
     @given(lst=list_strategy)
     def test_max_items_none(self, lst: list) -> None:
         result: list = serialize(lst, max_items=None)
         assert result == lst
 
-    @settings(max_examples=100)
     @given(obj=st.builds(object))
     def test_fallback_serialization(self, obj: object) -> None:
         result: str = serialize_or_str(obj)
@@ -0,0 +1,33 @@
+from unittest.mock import MagicMock
+
+import pytest
+from kozmoai.services.auth.utils import decrypt_api_key, encrypt_api_key, get_fernet
+from pydantic import SecretStr
+
+
+def _settings_service(secret_key: str):
+    settings_service = MagicMock()
+    settings_service.auth_settings.SECRET_KEY = SecretStr(secret_key)
+    return settings_service
+
+
+@pytest.mark.parametrize(
+    "secret_key",
+    ["short-secret", "tY3gC4d0oZ8qkH2wX9bV1nR6sJ5mL7pA0eF3uK8iQyM="],
+    ids=["short-key", "fernet-key"],
+)
+def test_get_fernet_reuses_instance_per_secret_key(secret_key):
+    assert get_fernet(_settings_service(secret_key)) is get_fernet(_settings_service(secret_key))
+
+
+def test_get_fernet_separates_secret_keys():
+    assert get_fernet(_settings_service("first-secret")) is not get_fernet(_settings_service("second-secret"))
+
+
+def test_encrypt_decrypt_api_key_round_trip():
+    settings_service = _settings_service("short-secret")
+
+    encrypted = encrypt_api_key("sk-test", settings_service=settings_service)
+
+    assert encrypted != "sk-test"
+    assert decrypt_api_key(encrypted, settings_service=settings_service) == "sk-test"
@@ -3,14 +3,20 @@ from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
 from kozmoai.services.database.models.variable.model import VariableUpdate
 from kozmoai.services.deps import get_settings_service
 from kozmoai.services.settings.constants import VARIABLES_TO_GET_FROM_ENVIRONMENT
-from kozmoai.services.variable.constants import CREDENTIAL_TYPE
+from kozmoai.services.variable.constants import CREDENTIAL_TYPE, GENERIC_TYPE
 from kozmoai.services.variable.service import DatabaseVariableService
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.pool import StaticPool
+
+# Share one event loop across the module so the engine fixture can be module scoped
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
 
 @pytest.fixture
@@ -19,16 +25,40 @@ def service():
     return DatabaseVariableService(settings_service)
 
 
-@pytest.fixture
-async def session():
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def engine():
+    # A single pooled connection keeps the in-memory schema alive for the whole module
+    engine = create_async_engine("sqlite+aiosqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+
+    # pysqlite/aiosqlite only open a transaction lazily, so the outer BEGIN never
+    # reaches SQLite and the service's commits become real commits. Take over
+    # transaction control so savepoints nest inside the per-test transaction.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, _connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
-    async with AsyncSession(engine, expire_on_commit=False) as session:
-        yield session
+    yield engine
+    await engine.dispose()
 
 
-async def test_initialize_user_variables__create_and_update(service, session: AsyncSession):
+@pytest_asyncio.fixture(loop_scope="module")
+async def session(engine):
+    # Commits made by the service only release a savepoint; rolling back the
+    # outer transaction discards everything the test wrote.
+    async with engine.connect() as conn:
+        await conn.begin()
+        async with AsyncSession(bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint") as session:
+            yield session
+        await conn.rollback()
+
+
+async def test_initialize_user_variables__create_and_update(service, session: AsyncSession, monkeypatch):
     user_id = uuid4()
     field = ""
     good_vars = {k: f"value{i}" for i, k in enumerate(VARIABLES_TO_GET_FROM_ENVIRONMENT)}
@@ -38,8 +68,9 @@ async def test_initialize_user_variables__create_and_update(service, session: As
     await service.create_variable(user_id, "OPENAI_API_KEY", "outdate", session=session)
     env_vars["OPENAI_API_KEY"] = "updated_value"
 
-    with patch.dict("os.environ", env_vars, clear=True):
-        await service.initialize_user_variables(user_id=user_id, session=session)
+    for name, value in env_vars.items():
+        monkeypatch.setenv(name, value)
+    await service.initialize_user_variables(user_id=user_id, session=session)
 
     variables = await service.list_variables(user_id, session=session)
     for name in variables:
@@ -50,11 +81,21 @@ async def test_initialize_user_variables__create_and_update(service, session: As
     assert all(i not in variables for i in bad_vars)
 
 
-async def test_initialize_user_variables__not_found_variable(service, session: AsyncSession):
-    with patch("kozmoai.services.variable.service.DatabaseVariableService.create_variable") as m:
+async def test_initialize_user_variables__not_found_variable(service, session: AsyncSession, monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "value")
+    with patch("kozmoai.services.variable.service.auth_utils.encrypt_api_key") as m:
         m.side_effect = Exception()
         await service.initialize_user_variables(uuid4(), session=session)
-    assert True
+    assert m.called
+
+
+async def test_initialize_user_variables__commit_failure(service, session: AsyncSession, monkeypatch):
+    user_id = uuid4()
+    monkeypatch.setenv("OPENAI_API_KEY", "value")
+    with patch.object(session, "commit", side_effect=Exception()):
+        await service.initialize_user_variables(user_id, session=session)
+
+    assert await service.list_variables(user_id, session=session) == []
 
 
 async def test_initialize_user_variables__skipping_environment_variable_storage(service, session: AsyncSession):
@@ -118,6 +159,21 @@ async def test_list_variables__empty(service, session: AsyncSession):
     assert isinstance(result, list)
 
 
+async def test_get_all(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.create_variable(user_id, "credential", "secret", session=session)
+    await service.create_variable(user_id, "generic", "plain", type_=GENERIC_TYPE, session=session)
+
+    result = {variable.name: variable for variable in await service.get_all(user_id, session=session)}
+
+    assert set(result) == {"credential", "generic"}
+    assert result["credential"].type == CREDENTIAL_TYPE
+    assert result["credential"].value is None
+    assert result["generic"].type == GENERIC_TYPE
+    assert result["generic"].value == "plain"
+    assert result["generic"].default_fields == []
+
+
 async def test_update_variable(service, session: AsyncSession):
     user_id = uuid4()
     name = "name"
@@ -1,6 +1,4 @@
 import json
-import os
-from unittest.mock import patch
 
 import pytest
 from kozmoai.logging.logger import SizedLogBuffer
@@ -17,10 +15,10 @@ def test_init_default():
     assert buffer._max_readers == 20
 
 
-def test_init_with_env_variable():
-    with patch.dict(os.environ, {"KOZMOAI_LOG_RETRIEVER_BUFFER_SIZE": "100"}):
-        buffer = SizedLogBuffer()
-        assert buffer.max == 100
+def test_init_with_env_variable(monkeypatch):
+    monkeypatch.setenv("KOZMOAI_LOG_RETRIEVER_BUFFER_SIZE", "100")
+    buffer = SizedLogBuffer()
+    assert buffer.max == 100
 
 
 def test_write(sized_log_buffer):
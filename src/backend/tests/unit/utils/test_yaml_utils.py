@@ -0,0 +1,14 @@
+import pytest
+import yaml
+from kozmoai.utils.yaml_utils import safe_load
+
+
+def test_safe_load_matches_yaml_safe_load():
+    document = "name: flow\nnodes:\n  - id: 1\n    enabled: true\n  - id: 2\n    ratio: 0.5\n"
+
+    assert safe_load(document) == yaml.safe_load(document)
+
+
+def test_safe_load_rejects_python_tags():
+    with pytest.raises(yaml.constructor.ConstructorError):
+        safe_load("!!python/object/apply:os.system ['echo unsafe']")